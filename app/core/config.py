@@ -7,6 +7,8 @@ class Settings(BaseSettings):
     OCR_LANGUAGES: list[str] = ["fr", "en"]
     MAX_FILE_SIZE_MB: int = 10
     API_KEY: str | None = None  # If None, auth is disabled (dev mode)
+    PAGE_STORE_DIR: str = "/tmp/ocr-page-store"  # Per-page PDF OCR results; empty disables
+    PAGE_STORE_TTL_HOURS: int = 24
 
     @property
     def auth_enabled(self) -> bool:
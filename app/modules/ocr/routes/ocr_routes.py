@@ -5,7 +5,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from app.core.auth import verify_api_key
 from app.core.config import get_settings
 from app.modules.ocr.services.ocr_service import get_ocr_service
-from app.modules.ocr.types.ocr_types import OCRResponse, OCRData, ExtractedImage, FileInfo
+from app.modules.ocr.types.ocr_types import (
+    OCRResponse,
+    OCRData,
+    ExtractedImage,
+    FailedPage,
+    FileInfo,
+)
 
 router = APIRouter()
 settings = get_settings()
@@ -49,6 +55,13 @@ async def extract_text(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OCR processing failed: {str(e)}")
 
+    failed_pages = None
+    if "failed_pages" in result:
+        failed_pages = [FailedPage(**page) for page in result["failed_pages"]]
+        if failed_pages and not result["pages_processed"]:
+            errors = "; ".join(f"page {p.page}: {p.error}" for p in failed_pages)
+            raise HTTPException(status_code=500, detail=f"OCR processing failed: {errors}")
+
     processing_time_ms = int((time.time() - start_time) * 1000)
 
     extracted_images = None
@@ -64,6 +77,7 @@ async def extract_text(
             processing_time_ms=processing_time_ms,
             pages=result.get("pages"),
             extracted_images=extracted_images,
+            failed_pages=failed_pages,
         ),
         file_info=FileInfo(
             name=file.filename or "unknown",
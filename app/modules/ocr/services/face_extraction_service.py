@@ -56,10 +56,11 @@ def extract_faces_from_image(
         pad_w = int(w * padding_ratio)
         pad_h = int(h * padding_ratio)
 
-        x1 = max(0, x - pad_w)
-        y1 = max(0, y - pad_h)
-        x2 = min(img_width, x + w + pad_w)
-        y2 = min(img_height, y + h + pad_h)
+        # detectMultiScale returns numpy ints; cast so results are JSON-serializable
+        x1 = int(max(0, x - pad_w))
+        y1 = int(max(0, y - pad_h))
+        x2 = int(min(img_width, x + w + pad_w))
+        y2 = int(min(img_height, y + h + pad_h))
 
         face_crop = image_rgb[y1:y2, x1:x2]
 
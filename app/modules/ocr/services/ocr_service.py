@@ -4,15 +4,25 @@ from typing import Any
 
 import easyocr
 import numpy as np
-from pdf2image import convert_from_bytes
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
 from PIL import Image
 
 from app.core.config import get_settings
 from app.modules.ocr.services.face_extraction_service import extract_faces_from_image
+from app.modules.ocr.services.page_store_service import (
+    fingerprint_settings,
+    get_page_store,
+    hash_document,
+)
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Rasterization DPI for PDF pages (150 is good balance of speed and accuracy)
+PDF_DPI = 150
+# Images larger than this on either side are downscaled before OCR
+MAX_IMAGE_DIMENSION = 2000
+
 # Global reader instance - loaded once at module import
 _ocr_reader: easyocr.Reader | None = None
 
@@ -36,8 +46,17 @@ class OCRService:
 
     def __init__(self):
         self._reader = get_ocr_reader()
+        self._page_store = get_page_store(
+            fingerprint_settings(
+                languages=settings.OCR_LANGUAGES,
+                dpi=PDF_DPI,
+                max_dimension=MAX_IMAGE_DIMENSION,
+            )
+        )
 
-    def _resize_if_large(self, image: Image.Image, max_dimension: int = 2000) -> Image.Image:
+    def _resize_if_large(
+        self, image: Image.Image, max_dimension: int = MAX_IMAGE_DIMENSION
+    ) -> Image.Image:
         """Resize image if too large to improve OCR speed."""
         width, height = image.size
         if width > max_dimension or height > max_dimension:
@@ -81,34 +100,52 @@ class OCRService:
     def extract_from_pdf(
         self, pdf_bytes: bytes, max_pages: int = 10, extract_images: bool = False
     ) -> dict[str, Any]:
-        """Extract text from a PDF by converting pages to images."""
-        # Convert with DPI limit for speed (150 is good balance)
-        images = convert_from_bytes(pdf_bytes, dpi=150)
+        """Extract text from a PDF by converting pages to images.
 
+        Each page is processed independently: a page that fails is reported in
+        ``failed_pages`` instead of aborting the whole document. When some pages
+        fail, the successful ones are kept in the page store so a retry only
+        reprocesses pages that are missing or previously failed.
+        """
         # Limit pages to prevent memory issues and long processing
-        total_pages = len(images)
-        images = images[:max_pages]
+        total_pages = pdfinfo_from_bytes(pdf_bytes)["Pages"]
+        page_count = min(total_pages, max_pages)
+        document_hash = hash_document(pdf_bytes)
+        if self._page_store is not None:
+            self._page_store.prune_expired()
 
         all_text = []
         all_confidences = []
         all_extracted_images = []
-
-        for i, image in enumerate(images, 1):
-            image = self._resize_if_large(image)
-            image_np = np.array(image.convert("RGB"))
-            results = self._reader.readtext(image_np, detail=1)
-
-            page_text = []
-            for bbox, text, confidence in results:
-                page_text.append(text)
-                all_confidences.append(confidence)
-
-            all_text.append(f"--- Page {i} ---\n{' '.join(page_text)}")
+        failed_pages = []
+
+        for i in range(1, page_count + 1):
+            page_result = None
+            if self._page_store is not None:
+                page_result = self._page_store.load(document_hash, i)
+            # Stored pages without face crops must be redone when images are requested
+            if extract_images and page_result and "extracted_images" not in page_result:
+                page_result = None
+
+            if page_result is None:
+                try:
+                    page_result = self._extract_pdf_page(pdf_bytes, i, extract_images)
+                except Exception as e:
+                    logger.exception("OCR failed on page %d of document %s", i, document_hash)
+                    failed_pages.append({"page": i, "error": str(e) or type(e).__name__})
+                    continue
+                if self._page_store is not None:
+                    self._page_store.save(document_hash, i, page_result)
+
+            all_text.append(f"--- Page {i} ---\n{page_result['text']}")
+            all_confidences.extend(page_result["confidences"])
 
             if extract_images:
-                all_extracted_images.extend(
-                    extract_faces_from_image(image, page_number=i)
-                )
+                all_extracted_images.extend(page_result["extracted_images"])
+
+        # Stored pages are only needed to resume a partial extraction
+        if self._page_store is not None and not failed_pages:
+            self._page_store.delete(document_hash)
 
         full_text = "\n\n".join(all_text)
         avg_confidence = (
@@ -119,9 +156,10 @@ class OCRService:
             "text": full_text,
             "confidence": round(avg_confidence, 2),
             "language_detected": self._detect_language(full_text),
-            "pages": len(images),
+            "pages": page_count,
             "total_pages": total_pages,
-            "pages_processed": len(images),
+            "pages_processed": page_count - len(failed_pages),
+            "failed_pages": failed_pages,
         }
 
         if extract_images:
@@ -129,6 +167,35 @@ class OCRService:
 
         return result
 
+    def _extract_pdf_page(
+        self, pdf_bytes: bytes, page_number: int, extract_images: bool
+    ) -> dict[str, Any]:
+        """Rasterize and OCR a single PDF page (1-indexed)."""
+        image = convert_from_bytes(
+            pdf_bytes, dpi=PDF_DPI, first_page=page_number, last_page=page_number
+        )[0]
+        image = self._resize_if_large(image)
+        image_np = np.array(image.convert("RGB"))
+        results = self._reader.readtext(image_np, detail=1)
+
+        page_text = []
+        confidences = []
+        for bbox, text, confidence in results:
+            page_text.append(text)
+            confidences.append(float(confidence))
+
+        page_result = {
+            "text": " ".join(page_text),
+            "confidences": confidences,
+        }
+
+        if extract_images:
+            page_result["extracted_images"] = extract_faces_from_image(
+                image, page_number=page_number
+            )
+
+        return page_result
+
     def _detect_language(self, text: str) -> str:
         """Simple language detection based on French-specific characters."""
         french_chars = set("àâçéèêëîïôùûüÿæœ")
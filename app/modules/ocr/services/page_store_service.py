@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def hash_document(content: bytes) -> str:
+    """Return the SHA-256 hex digest used to key a document's pages."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class PageStore:
+    """Local filesystem store for per-page OCR results.
+
+    Results are written as JSON files under
+    ``<root>/<document_hash>/<fingerprint>/<page>.json`` so a retried or resumed
+    extraction only reprocesses pages that are missing. The fingerprint
+    identifies the settings that shaped the results, so changing them makes
+    earlier results unreachable instead of serving them.
+    Only successful pages are stored; failed pages are always retried.
+
+    Entries are short-lived: a document's pages are deleted once all of them
+    succeed, and anything older than ``ttl_seconds`` is ignored and pruned.
+    """
+
+    def __init__(self, root: str | Path, fingerprint: str, ttl_seconds: float):
+        self._root = Path(root)
+        self._fingerprint = fingerprint
+        self._ttl_seconds = ttl_seconds
+
+    def _document_dir(self, document_hash: str) -> Path:
+        return self._root / document_hash
+
+    def _page_path(self, document_hash: str, page: int) -> Path:
+        return self._document_dir(document_hash) / self._fingerprint / f"{page}.json"
+
+    def _is_expired(self, mtime: float) -> bool:
+        return time.time() - mtime > self._ttl_seconds
+
+    def load(self, document_hash: str, page: int) -> dict[str, Any] | None:
+        """Return the stored result for a page, or None if missing, expired or unreadable."""
+        path = self._page_path(document_hash, page)
+        try:
+            if self._is_expired(path.stat().st_mtime):
+                return None
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable page result %s: %s", path, e)
+            return None
+
+    def save(self, document_hash: str, page: int, result: dict[str, Any]) -> None:
+        """Persist a page result atomically. Storage errors are logged, not raised."""
+        path = self._page_path(document_hash, page)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to persist page result %s: %s", path, e)
+
+    def delete(self, document_hash: str) -> None:
+        """Remove every stored page of a document, for all fingerprints."""
+        shutil.rmtree(self._document_dir(document_hash), ignore_errors=True)
+
+    def prune_expired(self) -> None:
+        """Remove documents whose most recent page result is older than the TTL."""
+        try:
+            document_dirs = [d for d in self._root.iterdir() if d.is_dir()]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("Failed to scan page store %s: %s", self._root, e)
+            return
+
+        for document_dir in document_dirs:
+            try:
+                mtimes = [document_dir.stat().st_mtime]
+                mtimes.extend(p.stat().st_mtime for p in document_dir.rglob("*.json"))
+            except OSError:
+                continue
+            if self._is_expired(max(mtimes)):
+                shutil.rmtree(document_dir, ignore_errors=True)
+
+
+def fingerprint_settings(**values: Any) -> str:
+    """Return a short stable hash of the settings that shape page results."""
+    encoded = json.dumps(values, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def get_page_store(fingerprint: str) -> PageStore | None:
+    """Return the page store, or None when PAGE_STORE_DIR is empty (store disabled)."""
+    if not settings.PAGE_STORE_DIR:
+        return None
+    return PageStore(
+        settings.PAGE_STORE_DIR, fingerprint, settings.PAGE_STORE_TTL_HOURS * 3600
+    )
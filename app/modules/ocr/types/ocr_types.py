@@ -17,6 +17,13 @@ class ExtractedImage(BaseModel):
     image_height: int
 
 
+class FailedPage(BaseModel):
+    """A PDF page whose extraction failed; the other pages are still returned."""
+
+    page: int
+    error: str
+
+
 class OCRData(BaseModel):
     text: str
     confidence: float
@@ -24,6 +31,7 @@ class OCRData(BaseModel):
     processing_time_ms: int
     pages: int | None = None
     extracted_images: list[ExtractedImage] | None = None
+    failed_pages: list[FailedPage] | None = None
 
 
 class OCRResponse(BaseModel):
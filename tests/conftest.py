@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from app.modules.ocr.services import ocr_service, page_store_service
+
+
+class FakePdf:
+    """Stand-in for pdf2image and EasyOCR that OCRs pages of a fake PDF.
+
+    Pages listed in ``failing_pages`` raise ``page_error(page)`` from
+    ``readtext``; every page that reaches OCR is recorded in ``ocr_calls``.
+    """
+
+    def __init__(self, page_count: int):
+        self.page_count = page_count
+        self.failing_pages: set[int] = set()
+        self.page_error = lambda page: RuntimeError(f"boom on page {page}")
+        self.ocr_calls: list[int] = []
+        self._current_page: int | None = None
+
+    def pdfinfo_from_bytes(self, pdf_bytes, *args, **kwargs):
+        return {"Pages": self.page_count}
+
+    def convert_from_bytes(self, pdf_bytes, *args, first_page=None, last_page=None, **kwargs):
+        self._current_page = first_page
+        return [Image.new("RGB", (100, 100), "white")]
+
+    def readtext(self, image_np, detail=1):
+        page = self._current_page
+        self.ocr_calls.append(page)
+        if page in self.failing_pages:
+            raise self.page_error(page)
+        return [([[0, 0], [1, 0], [1, 1], [0, 1]], f"text {page}", 0.9)]
+
+
+@pytest.fixture
+def page_store_dir(tmp_path, monkeypatch):
+    store_dir = tmp_path / "page-store"
+    monkeypatch.setattr(page_store_service.settings, "PAGE_STORE_DIR", str(store_dir))
+    return store_dir
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch, page_store_dir):
+    pdf = FakePdf(page_count=3)
+    reader = MagicMock()
+    reader.readtext.side_effect = pdf.readtext
+    monkeypatch.setattr(ocr_service, "_ocr_reader", reader)
+    monkeypatch.setattr(ocr_service, "pdfinfo_from_bytes", pdf.pdfinfo_from_bytes)
+    monkeypatch.setattr(ocr_service, "convert_from_bytes", pdf.convert_from_bytes)
+    return pdf
@@ -0,0 +1,20 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+from PIL import Image
+
+from app.modules.ocr.services import face_extraction_service
+from app.modules.ocr.services.face_extraction_service import extract_faces_from_image
+
+
+def test_extracted_faces_are_json_serializable(monkeypatch):
+    cascade = MagicMock()
+    cascade.detectMultiScale.return_value = np.array([[20, 20, 40, 40]], dtype=np.int32)
+    monkeypatch.setattr(face_extraction_service, "_face_cascade", cascade)
+
+    faces = extract_faces_from_image(Image.new("RGB", (100, 100), "white"), page_number=1)
+
+    assert len(faces) == 1
+    assert faces[0]["bbox"] == {"x": 6, "y": 6, "width": 68, "height": 68}
+    json.dumps(faces)
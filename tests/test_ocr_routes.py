@@ -0,0 +1,73 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.auth import verify_api_key
+from app.modules.ocr.routes.ocr_routes import router
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/ocr")
+    app.dependency_overrides[verify_api_key] = lambda: None
+    return TestClient(app)
+
+
+def _post_pdf(client, content: bytes = b"%PDF-fake"):
+    return client.post(
+        "/api/v1/ocr/extract",
+        files={"file": ("doc.pdf", content, "application/pdf")},
+    )
+
+
+def test_failed_page_is_reported_and_others_returned(client, fake_pdf):
+    fake_pdf.failing_pages = {2}
+
+    response = _post_pdf(client)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["failed_pages"] == [{"page": 2, "error": "boom on page 2"}]
+    assert "--- Page 1 ---\ntext 1" in data["text"]
+    assert "--- Page 3 ---\ntext 3" in data["text"]
+    assert "Page 2" not in data["text"]
+
+
+def test_all_pages_failing_returns_500(client, fake_pdf):
+    fake_pdf.failing_pages = {1, 2, 3}
+
+    response = _post_pdf(client)
+
+    assert response.status_code == 500
+    assert "page 1: boom on page 1" in response.json()["detail"]
+
+
+def test_failed_page_without_message_reports_exception_type(client, fake_pdf):
+    fake_pdf.failing_pages = {1, 2, 3}
+    fake_pdf.page_error = lambda page: IndexError()
+
+    response = _post_pdf(client)
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == (
+        "OCR processing failed: page 1: IndexError; page 2: IndexError; page 3: IndexError"
+    )
+
+
+def test_retry_only_reprocesses_failed_pages(client, fake_pdf, page_store_dir):
+    fake_pdf.failing_pages = {2}
+    assert _post_pdf(client).status_code == 200
+    assert fake_pdf.ocr_calls == [1, 2, 3]
+
+    fake_pdf.failing_pages = set()
+    fake_pdf.ocr_calls.clear()
+    response = _post_pdf(client)
+
+    assert response.status_code == 200
+    assert fake_pdf.ocr_calls == [2]
+    data = response.json()["data"]
+    assert data["failed_pages"] == []
+    assert "--- Page 2 ---\ntext 2" in data["text"]
+    # Fully extracted documents are not kept in the store
+    assert not any(page_store_dir.iterdir())
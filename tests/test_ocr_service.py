@@ -0,0 +1,29 @@
+from app.modules.ocr.services import ocr_service, page_store_service
+from app.modules.ocr.services.ocr_service import OCRService
+
+
+def test_store_disabled_reprocesses_every_page(fake_pdf, monkeypatch, page_store_dir):
+    monkeypatch.setattr(page_store_service.settings, "PAGE_STORE_DIR", "")
+    fake_pdf.failing_pages = {2}
+    OCRService().extract_from_pdf(b"%PDF-fake")
+
+    fake_pdf.ocr_calls.clear()
+    OCRService().extract_from_pdf(b"%PDF-fake")
+
+    assert fake_pdf.ocr_calls == [1, 2, 3]
+    assert not page_store_dir.exists()
+
+
+def test_stored_page_without_images_is_redone_when_images_requested(
+    fake_pdf, monkeypatch
+):
+    monkeypatch.setattr(ocr_service, "extract_faces_from_image", lambda image, page_number: [])
+    fake_pdf.failing_pages = {3}
+    OCRService().extract_from_pdf(b"%PDF-fake")
+
+    fake_pdf.failing_pages = set()
+    fake_pdf.ocr_calls.clear()
+    result = OCRService().extract_from_pdf(b"%PDF-fake", extract_images=True)
+
+    assert fake_pdf.ocr_calls == [1, 2, 3]
+    assert result["extracted_images"] == []
@@ -0,0 +1,106 @@
+import json
+import os
+import time
+
+import numpy as np
+
+from app.modules.ocr.services import page_store_service
+from app.modules.ocr.services.page_store_service import (
+    PageStore,
+    fingerprint_settings,
+    get_page_store,
+    hash_document,
+)
+
+
+def _page_result() -> dict:
+    return {
+        "text": "hello",
+        "confidences": [0.9, 0.8],
+        "extracted_images": [
+            {
+                "image_base64": "aGVsbG8=",
+                "page": 1,
+                "bbox": {"x": 1, "y": 2, "width": 3, "height": 4},
+                "image_width": 3,
+                "image_height": 4,
+            }
+        ],
+    }
+
+
+def test_save_load_round_trip_with_extracted_images(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=3600)
+    document_hash = hash_document(b"pdf")
+
+    store.save(document_hash, 1, _page_result())
+
+    assert store.load(document_hash, 1) == _page_result()
+    assert store.load(document_hash, 2) is None
+
+
+def test_save_swallows_unserializable_result(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=3600)
+    result = _page_result()
+    result["extracted_images"][0]["bbox"]["x"] = np.int32(1)
+
+    store.save("doc", 1, result)
+
+    assert store.load("doc", 1) is None
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_load_ignores_corrupt_entry(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=3600)
+    path = tmp_path / "doc" / "fp" / "1.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+
+    assert store.load("doc", 1) is None
+
+
+def test_fingerprint_isolates_results(tmp_path):
+    fingerprint = fingerprint_settings(languages=["fr", "en"], dpi=150, max_dimension=2000)
+    other = fingerprint_settings(languages=["en"], dpi=150, max_dimension=2000)
+    assert fingerprint != other
+
+    PageStore(tmp_path, fingerprint, ttl_seconds=3600).save("doc", 1, _page_result())
+
+    assert PageStore(tmp_path, other, ttl_seconds=3600).load("doc", 1) is None
+
+
+def test_expired_entries_are_ignored_and_pruned(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=60)
+    store.save("old", 1, _page_result())
+    store.save("new", 1, _page_result())
+    stale = time.time() - 120
+    for path in [tmp_path / "old", *(tmp_path / "old").rglob("*")]:
+        os.utime(path, (stale, stale))
+
+    assert store.load("old", 1) is None
+    store.prune_expired()
+
+    assert not (tmp_path / "old").exists()
+    assert store.load("new", 1) is not None
+
+
+def test_delete_removes_document(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=3600)
+    store.save("doc", 1, _page_result())
+
+    store.delete("doc")
+
+    assert not (tmp_path / "doc").exists()
+
+
+def test_empty_store_dir_disables_store(monkeypatch):
+    monkeypatch.setattr(page_store_service.settings, "PAGE_STORE_DIR", "")
+
+    assert get_page_store("fp") is None
+
+
+def test_saved_file_is_plain_json(tmp_path):
+    store = PageStore(tmp_path, "fp", ttl_seconds=3600)
+    store.save("doc", 2, _page_result())
+
+    assert json.loads((tmp_path / "doc" / "fp" / "2.json").read_text()) == _page_result()